@@ -1,135 +1,311 @@
 import pandas as pd
 import numpy as np
+import hashlib
+import os
+import tempfile
 from datetime import datetime, timedelta
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from pathlib import Path
+import pyarrow.parquet as pq
+import xlsxwriter
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # numba is optional; np.bincount handles every size on its own
+    njit = None
+
+# Income Statement line items, in the order generate_income_statement reports them
+_IS_LABELS = (
+    'Revenue',
+    'Cost of Goods Sold',
+    'Gross Profit',
+    'Operating Expenses',
+    'Operating Income',
+    'Interest Expense',
+    'Other Income',
+    'Pre-tax Income',
+    'Tax Expense',
+    'Net Income'
+)
+
+# Balance Sheet line items; headings and blank spacer rows carry no amount
+_BS_LABELS = (
+    'ASSETS',
+    'Current Assets:',
+    '  Cash',
+    '  Accounts Receivable',
+    '  Inventory',
+    'Total Current Assets',
+    'Fixed Assets:',
+    '  PP&E',
+    'TOTAL ASSETS',
+    '',
+    'LIABILITIES & EQUITY',
+    'Current Liabilities:',
+    '  Accounts Payable',
+    '  Short-term Debt',
+    'Total Current Liabilities',
+    'Long-term Debt',
+    'Total Liabilities',
+    '',
+    'Equity:',
+    '  Common Stock',
+    '  Retained Earnings',
+    'Total Equity',
+    '',
+    'TOTAL LIABILITIES & EQUITY'
+)
+
+
+# Category and account vocabularies; a label's position is its integer code.
+# Statements only read the leading entries, so those get named constants.
+_CATEGORIES = (
+    'Revenue',
+    'COGS',
+    'Sales & Marketing',
+    'General & Administrative',
+    'R&D',
+    'Interest Expense',
+    'Other Income',
+    'Asset',
+    'Liability',
+    'Equity'
+)
+(_CAT_REVENUE, _CAT_COGS, _CAT_SALES_MARKETING, _CAT_GENERAL_ADMIN, _CAT_RD,
+ _CAT_INTEREST_EXPENSE, _CAT_OTHER_INCOME) = range(7)
+
+_ACCOUNTS = (
+    'Cash',
+    'Accounts Receivable',
+    'Inventory',
+    'PP&E',
+    'Accounts Payable',
+    'Short-term Debt',
+    'Long-term Debt',
+    'Common Stock',
+    'Retained Earnings'
+)
+(_ACCT_CASH, _ACCT_RECEIVABLE, _ACCT_INVENTORY, _ACCT_PPE, _ACCT_PAYABLE,
+ _ACCT_SHORT_TERM_DEBT, _ACCT_LONG_TERM_DEBT, _ACCT_COMMON_STOCK,
+ _ACCT_RETAINED_EARNINGS) = range(len(_ACCOUNTS))
+
+
+def _period_code(period):
+    """Encode a month ('2024-11', Period or Timestamp) as year*12 + month - 1"""
+    period = pd.Period(period, freq='M')
+    return period.year * 12 + period.month - 1
+
+
+def _period_label(code):
+    """Format a month code from _period_code as 'YYYY-MM'"""
+    return f"{code // 12}-{code % 12 + 1:02d}"
+
+
+# Part of every cached income statement's filename; bump it whenever the
+# statement logic changes (vocabularies, line items, tax rate) so files
+# written by older code are never read back
+_IS_CACHE_VERSION = 1
+
+# Below this many rows np.bincount beats starting the parallel kernel
+_NUMBA_MIN_ROWS = 1_000_000
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _sum_by_code_parallel(codes, amounts, n_bins, n_chunks):
+        """Per-code totals, one private accumulator per thread chunk"""
+        n = len(codes)
+        step = (n + n_chunks - 1) // n_chunks
+        partial = np.zeros((n_chunks, n_bins))
+        for c in prange(n_chunks):
+            for i in range(c * step, min(n, (c + 1) * step)):
+                partial[c, codes[i]] += amounts[i]
+        return partial.sum(axis=0)
+
+
+def _sum_by_code(codes, amounts, n_bins):
+    """Total of amounts for each code in range(n_bins), as float64"""
+    if njit is not None and len(codes) >= _NUMBA_MIN_ROWS:
+        return _sum_by_code_parallel(codes, amounts, n_bins, get_num_threads())
+    return np.bincount(codes, weights=amounts, minlength=n_bins)
+
+
+def _label_codes(values, vocab, order):
+    """Integer codes into vocab for a label column, in row order
+
+    Missing or unknown labels get the code one past the vocabulary, so every
+    code is a valid np.bincount bin.
+    """
+    codes = pd.Categorical(values, categories=vocab).codes[order]
+    codes[codes < 0] = len(vocab)
+    return codes
+
 
 class FinancialStatementGenerator:
     """Generate financial statements from transaction data"""
     
-    def __init__(self, transactions_df):
+    def __init__(self, transactions_df, cache_dir=None):
         """
         Initialize with transaction data
         
         Expected columns: date, account, category, amount, type (debit/credit)
+        
+        If cache_dir is given, income statements are also stored there as
+        parquet files keyed by a hash of the data, so later runs over the same
+        transactions read them back instead of recomputing.
         """
-        self.df = transactions_df.copy()
-        self.df['date'] = pd.to_datetime(self.df['date'])
-        self.df['period'] = self.df['date'].dt.to_period('M')
+        # The caller's frame is kept as-is; statements are computed from the
+        # column arrays below, held in date order so as-of queries are prefixes
+        self.df = transactions_df
+        dates = pd.to_datetime(transactions_df['date'])
+        # Bucket by local wall time; as-of dates are brought into the same zone
+        self._tz = dates.dt.tz
+        if self._tz is not None:
+            dates = dates.dt.tz_localize(None)
+        dates = dates.to_numpy()
+        # argsort puts undated rows last: they still count toward the unfiltered
+        # totals, but periods and as-of searches only look at the dated prefix
+        order = np.argsort(dates, kind='stable')
+        self._date = dates[order]
+        self._n_dated = int(np.count_nonzero(~np.isnat(self._date)))
+        # Month buckets as plain int32 codes (see _period_code)
+        self._period = (self._date[:self._n_dated].astype('datetime64[M]').astype(np.int32)
+                        + np.int32(1970 * 12))
+        # float64 throughout: a float32 cast drifts by cents once summed;
+        # missing amounts count as zero, as pandas' sum() skipped them
+        amounts = pd.to_numeric(transactions_df['amount'])
+        self._amount = amounts.fillna(0).to_numpy(dtype=np.float64)[order]
+        
+        # Small integer codes into _CATEGORIES / _ACCOUNTS
+        self._cat_codes = _label_codes(transactions_df['category'], _CATEGORIES, order)
+        self._acct_codes = _label_codes(transactions_df['account'], _ACCOUNTS, order)
+        
+        # Income statements keyed by period; rebuild the generator if the data changes
+        self._is_cache = {}
+        
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # Hash the arrays statements are computed from, not the raw columns:
+            # the same instants in another time zone fall into different months
+            digest = hashlib.blake2b(digest_size=8)
+            digest.update(np.int64(self._n_dated).tobytes())
+            for values in (self._period, self._cat_codes, self._amount):
+                digest.update(np.ascontiguousarray(values).tobytes())
+            self._data_hash = digest.hexdigest()
         
     def generate_income_statement(self, period=None):
         """Generate Income Statement for specified period"""
-        if period:
-            data = self.df[self.df['period'] == period]
-        else:
-            data = self.df
-            
+        key = _period_code(period) if period else None
+        if key not in self._is_cache:
+            self._is_cache[key] = self._load_income_statement(key)
+        return self._is_cache[key].copy()
+    
+    def _load_income_statement(self, period):
+        """Read the Income Statement from cache_dir, computing and storing it on a miss"""
+        if self._cache_dir is None:
+            return self._build_income_statement(period)
+        
+        label = _period_label(period) if period is not None else 'all'
+        path = self._cache_dir / f"is_v{_IS_CACHE_VERSION}_{self._data_hash}_{label}.parquet"
+        if path.exists():
+            return pq.read_table(path).to_pandas()
+        
+        statement = self._build_income_statement(period)
+        # Write beside the target and rename into place, so an interrupted or
+        # concurrent run never leaves a truncated file under the final name
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            statement.to_parquet(tmp_path, compression='zstd', index=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return statement
+    
+    def _build_income_statement(self, period):
+        """Compute the Income Statement for a period (None for all data)"""
+        rows = self._period_slice(period) if period is not None else slice(None)
+        totals = _sum_by_code(self._cat_codes[rows], self._amount[rows], len(_CATEGORIES) + 1)
+        
         # Revenue
-        revenue = data[data['category'] == 'Revenue']['amount'].sum()
+        revenue = totals[_CAT_REVENUE]
         
         # Cost of Goods Sold
-        cogs = data[data['category'] == 'COGS']['amount'].sum()
+        cogs = totals[_CAT_COGS]
         gross_profit = revenue - cogs
         
         # Operating Expenses
-        operating_exp = data[data['category'].isin([
-            'Sales & Marketing', 'General & Administrative', 'R&D'
-        ])]['amount'].sum()
+        operating_exp = (totals[_CAT_SALES_MARKETING] + totals[_CAT_GENERAL_ADMIN]
+                         + totals[_CAT_RD])
         
         operating_income = gross_profit - operating_exp
         
         # Other Income/Expenses
-        interest_expense = data[data['category'] == 'Interest Expense']['amount'].sum()
-        other_income = data[data['category'] == 'Other Income']['amount'].sum()
+        interest_expense = totals[_CAT_INTEREST_EXPENSE]
+        other_income = totals[_CAT_OTHER_INCOME]
         
         pretax_income = operating_income - interest_expense + other_income
         tax_expense = pretax_income * 0.25  # 25% tax rate assumption
         net_income = pretax_income - tax_expense
         
-        return pd.DataFrame({
-            'Line Item': [
-                'Revenue',
-                'Cost of Goods Sold',
-                'Gross Profit',
-                'Operating Expenses',
-                'Operating Income',
-                'Interest Expense',
-                'Other Income',
-                'Pre-tax Income',
-                'Tax Expense',
-                'Net Income'
-            ],
-            'Amount': [
-                revenue,
-                -cogs,
-                gross_profit,
-                -operating_exp,
-                operating_income,
-                -interest_expense,
-                other_income,
-                pretax_income,
-                -tax_expense,
-                net_income
-            ]
-        })
+        amounts = np.array([
+            revenue,
+            -cogs,
+            gross_profit,
+            -operating_exp,
+            operating_income,
+            -interest_expense,
+            other_income,
+            pretax_income,
+            -tax_expense,
+            net_income
+        ], dtype=np.float64)
+        return pd.DataFrame({'Line Item': _IS_LABELS, 'Amount': amounts})
+    
+    def _period_slice(self, period):
+        """Row range of a period code; dated rows are sorted, so it is contiguous"""
+        lo = self._period.searchsorted(period, side='left')
+        hi = self._period.searchsorted(period, side='right')
+        return slice(lo, hi)
     
     def generate_balance_sheet(self, as_of_date=None):
         """Generate Balance Sheet as of specified date"""
         if as_of_date:
-            data = self.df[self.df['date'] <= as_of_date]
+            as_of = pd.Timestamp(as_of_date)
+            if as_of.tz is not None:
+                if self._tz is None:
+                    raise ValueError("as_of_date is tz-aware but the transaction dates are not")
+                as_of = as_of.tz_convert(self._tz).tz_localize(None)
+            as_of = np.datetime64(as_of)
+            k = self._date[:self._n_dated].searchsorted(as_of, side='right')
         else:
-            data = self.df
-            
+            k = len(self._date)
+        totals = _sum_by_code(self._acct_codes[:k], self._amount[:k], len(_ACCOUNTS) + 1)
+        
         # Assets
-        cash = data[data['account'] == 'Cash']['amount'].sum()
-        ar = data[data['account'] == 'Accounts Receivable']['amount'].sum()
-        inventory = data[data['account'] == 'Inventory']['amount'].sum()
+        cash = totals[_ACCT_CASH]
+        ar = totals[_ACCT_RECEIVABLE]
+        inventory = totals[_ACCT_INVENTORY]
         current_assets = cash + ar + inventory
         
-        ppe = data[data['account'] == 'PP&E']['amount'].sum()
+        ppe = totals[_ACCT_PPE]
         total_assets = current_assets + ppe
         
         # Liabilities
-        ap = data[data['account'] == 'Accounts Payable']['amount'].sum()
-        short_term_debt = data[data['account'] == 'Short-term Debt']['amount'].sum()
+        ap = totals[_ACCT_PAYABLE]
+        short_term_debt = totals[_ACCT_SHORT_TERM_DEBT]
         current_liabilities = ap + short_term_debt
         
-        long_term_debt = data[data['account'] == 'Long-term Debt']['amount'].sum()
+        long_term_debt = totals[_ACCT_LONG_TERM_DEBT]
         total_liabilities = current_liabilities + long_term_debt
         
         # Equity
-        common_stock = data[data['account'] == 'Common Stock']['amount'].sum()
-        retained_earnings = data[data['account'] == 'Retained Earnings']['amount'].sum()
+        common_stock = totals[_ACCT_COMMON_STOCK]
+        retained_earnings = totals[_ACCT_RETAINED_EARNINGS]
         total_equity = common_stock + retained_earnings
         
         return pd.DataFrame({
-            'Line Item': [
-                'ASSETS',
-                'Current Assets:',
-                '  Cash',
-                '  Accounts Receivable',
-                '  Inventory',
-                'Total Current Assets',
-                'Fixed Assets:',
-                '  PP&E',
-                'TOTAL ASSETS',
-                '',
-                'LIABILITIES & EQUITY',
-                'Current Liabilities:',
-                '  Accounts Payable',
-                '  Short-term Debt',
-                'Total Current Liabilities',
-                'Long-term Debt',
-                'Total Liabilities',
-                '',
-                'Equity:',
-                '  Common Stock',
-                '  Retained Earnings',
-                'Total Equity',
-                '',
-                'TOTAL LIABILITIES & EQUITY'
-            ],
+            'Line Item': _BS_LABELS,
             'Amount': [
                 None,
                 None,
@@ -167,132 +343,167 @@ class FinancialStatementGenerator:
         variance_df['Prior Period'] = prior['Amount']
         variance_df['Current Period'] = current['Amount']
         variance_df['Variance $'] = variance_df['Current Period'] - variance_df['Prior Period']
-        variance_df['Variance %'] = (variance_df['Variance $'] / variance_df['Prior Period'].replace(0, np.nan) * 100).round(1)
+        
+        # Percent change, left as NaN where the prior period is zero
+        var_dollar = variance_df['Variance $'].to_numpy(dtype=np.float64)
+        prior_amt = variance_df['Prior Period'].to_numpy(dtype=np.float64)
+        var_pct = np.divide(var_dollar, prior_amt, out=np.full(prior_amt.shape, np.nan),
+                            where=prior_amt != 0)
+        var_pct *= 100
+        np.round(var_pct, 1, out=var_pct)
+        variance_df['Variance %'] = var_pct
         
         return variance_df[['Line Item', 'Prior Period', 'Current Period', 'Variance $', 'Variance %']]
     
     def export_to_excel(self, filename='financial_statements.xlsx'):
         """Export all statements to formatted Excel file"""
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
+        # constant_memory flushes each row to disk as soon as it is written
+        wb = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        formats = {
+            'title': wb.add_format({'bold': True, 'font_size': 14}),
+            'header': wb.add_format({'bold': True, 'bg_color': '#366092',
+                                     'font_color': '#FFFFFF', 'align': 'center'}),
+            'currency': wb.add_format({'num_format': '$#,##0.00', 'align': 'right'})
+        }
         
         # Get current and prior period
-        periods = sorted(self.df['period'].unique())
-        current_period = periods[-1]
-        prior_period = periods[-2] if len(periods) > 1 else periods[-1]
+        periods = np.unique(self._period)
+        current_period = _period_label(periods[-1])
+        prior_period = _period_label(periods[-2] if len(periods) > 1 else periods[-1])
         
         # Income Statement
-        ws_is = wb.create_sheet('Income Statement')
+        ws_is = wb.add_worksheet('Income Statement')
         is_df = self.generate_income_statement(current_period)
-        self._format_sheet(ws_is, is_df, f'Income Statement - {current_period}')
+        self._format_sheet(ws_is, is_df, f'Income Statement - {current_period}', formats)
         
         # Balance Sheet
-        ws_bs = wb.create_sheet('Balance Sheet')
+        ws_bs = wb.add_worksheet('Balance Sheet')
         bs_df = self.generate_balance_sheet()
-        self._format_sheet(ws_bs, bs_df, f'Balance Sheet - {current_period}')
+        self._format_sheet(ws_bs, bs_df, f'Balance Sheet - {current_period}', formats)
         
         # Variance Analysis
-        ws_var = wb.create_sheet('Variance Analysis')
+        ws_var = wb.add_worksheet('Variance Analysis')
         var_df = self.generate_variance_analysis(current_period, prior_period)
-        self._format_sheet(ws_var, var_df, f'Variance Analysis: {prior_period} vs {current_period}')
+        self._format_sheet(ws_var, var_df, f'Variance Analysis: {prior_period} vs {current_period}', formats)
         
-        wb.save(filename)
+        wb.close()
         print(f"Financial statements exported to {filename}")
         
-    def _format_sheet(self, ws, df, title):
+    def _format_sheet(self, ws, df, title, formats):
         """Apply formatting to Excel sheet"""
-        # Title
-        ws.append([title])
-        ws['A1'].font = Font(bold=True, size=14)
-        ws.append([])
+        # Only the amount columns hold numbers; decide each column's format once
+        numeric = [pd.api.types.is_numeric_dtype(df[column]) for column in df.columns]
         
-        # Add dataframe
-        for r in dataframe_to_rows(df, index=False, header=True):
-            ws.append(r)
+        # Adjust column widths from the data itself rather than re-reading every cell
+        for i, column in enumerate(df.columns):
+            values = df[column]
+            max_length = len(str(column))
+            if numeric[i]:
+                largest = values.abs().max()
+                if pd.notna(largest):
+                    sign = 1 if values.min() < 0 else 0
+                    max_length = max(max_length, len(f"${largest:,.2f}") + sign)
+            else:
+                max_length = max(max_length, values.astype(str).str.len().max())
+            if i == 0:
+                max_length = max(max_length, len(title))
+            ws.set_column(i, i, min(max_length + 2, 50))
+        
+        # Title; constant_memory sheets must be written top to bottom
+        ws.write(0, 0, title, formats['title'])
         
         # Format header
-        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        header_font = Font(color='FFFFFF', bold=True)
-        
-        for cell in ws[3]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
-        
-        # Format numbers
-        for row in ws.iter_rows(min_row=4, max_row=ws.max_row):
-            for cell in row:
-                if isinstance(cell.value, (int, float)) and cell.value is not None:
-                    cell.number_format = '$#,##0.00'
-                    cell.alignment = Alignment(horizontal='right')
-        
-        # Adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        ws.write_row(2, 0, list(df.columns), formats['header'])
+        
+        # Add dataframe, formatting numbers as they are written
+        for row_num, r in enumerate(df.itertuples(index=False, name=None), start=3):
+            for col_num, value in enumerate(r):
+                if not numeric[col_num]:
+                    ws.write(row_num, col_num, value)
+                elif pd.isna(value):
+                    ws.write_blank(row_num, col_num, None, formats['currency'])
+                else:
+                    ws.write_number(row_num, col_num, value, formats['currency'])
 
 
 def generate_sample_data():
     """Generate sample transaction data for demonstration"""
     np.random.seed(42)
     dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
+    weekly = dates[::7].values
+    monthly = dates[::30].values
     
-    transactions = []
+    accounts = ['Cash', 'Inventory', 'Accounts Receivable', 'PP&E',
+                'Accounts Payable', 'Long-term Debt', 'Common Stock', 'Retained Earnings']
+    categories = ['Revenue', 'COGS', 'Sales & Marketing', 'General & Administrative',
+                  'R&D', 'Asset', 'Liability', 'Equity']
+    types = ['credit', 'debit']
     
-    # Generate revenue transactions
-    for date in dates[::7]:  # Weekly revenue
-        transactions.append({
-            'date': date,
-            'account': 'Cash',
-            'category': 'Revenue',
-            'amount': np.random.uniform(50000, 100000),
-            'type': 'credit'
-        })
+    # Opening balance sheet entries: (account, category, amount, type)
+    opening = [
+        ('Cash', 'Asset', 500000, 'debit'),
+        ('Accounts Receivable', 'Asset', 150000, 'debit'),
+        ('Inventory', 'Asset', 100000, 'debit'),
+        ('PP&E', 'Asset', 300000, 'debit'),
+        ('Accounts Payable', 'Liability', 80000, 'credit'),
+        ('Long-term Debt', 'Liability', 200000, 'credit'),
+        ('Common Stock', 'Equity', 500000, 'credit'),
+        ('Retained Earnings', 'Equity', 270000, 'credit')
+    ]
+    
+    n_weekly = len(weekly)
+    n_opex = 3 * len(monthly)
+    total = 2 * n_weekly + n_opex + len(opening)
+    
+    date_arr = np.empty(total, dtype=dates.values.dtype)
+    amounts = np.empty(total, dtype=np.float64)
+    account_codes = np.empty(total, dtype=np.int8)
+    category_codes = np.empty(total, dtype=np.int8)
+    type_codes = np.empty(total, dtype=np.int8)
+    
+    # Generate revenue transactions (weekly)
+    rows = slice(0, n_weekly)
+    date_arr[rows] = weekly
+    amounts[rows] = np.random.uniform(50000, 100000, n_weekly)
+    account_codes[rows] = accounts.index('Cash')
+    category_codes[rows] = categories.index('Revenue')
+    type_codes[rows] = types.index('credit')
     
     # Generate COGS
-    for date in dates[::7]:
-        transactions.append({
-            'date': date,
-            'account': 'Inventory',
-            'category': 'COGS',
-            'amount': np.random.uniform(20000, 40000),
-            'type': 'debit'
-        })
+    rows = slice(n_weekly, 2 * n_weekly)
+    date_arr[rows] = weekly
+    amounts[rows] = np.random.uniform(20000, 40000, n_weekly)
+    account_codes[rows] = accounts.index('Inventory')
+    category_codes[rows] = categories.index('COGS')
+    type_codes[rows] = types.index('debit')
     
-    # Operating expenses
-    for date in dates[::30]:  # Monthly
-        transactions.extend([
-            {'date': date, 'account': 'Cash', 'category': 'Sales & Marketing', 
-             'amount': np.random.uniform(15000, 25000), 'type': 'debit'},
-            {'date': date, 'account': 'Cash', 'category': 'General & Administrative',
-             'amount': np.random.uniform(10000, 20000), 'type': 'debit'},
-            {'date': date, 'account': 'Cash', 'category': 'R&D',
-             'amount': np.random.uniform(8000, 15000), 'type': 'debit'}
-        ])
+    # Operating expenses (monthly): Sales & Marketing, G&A, R&D per date
+    rows = slice(2 * n_weekly, 2 * n_weekly + n_opex)
+    date_arr[rows] = np.repeat(monthly, 3)
+    amounts[rows] = np.random.uniform(
+        [15000, 10000, 8000], [25000, 20000, 15000], (len(monthly), 3)
+    ).ravel()
+    account_codes[rows] = accounts.index('Cash')
+    category_codes[rows] = np.tile([
+        categories.index(cat) for cat in ('Sales & Marketing', 'General & Administrative', 'R&D')
+    ], len(monthly))
+    type_codes[rows] = types.index('debit')
     
     # Balance sheet accounts
-    transactions.extend([
-        {'date': dates[0], 'account': 'Cash', 'category': 'Asset', 'amount': 500000, 'type': 'debit'},
-        {'date': dates[0], 'account': 'Accounts Receivable', 'category': 'Asset', 'amount': 150000, 'type': 'debit'},
-        {'date': dates[0], 'account': 'Inventory', 'category': 'Asset', 'amount': 100000, 'type': 'debit'},
-        {'date': dates[0], 'account': 'PP&E', 'category': 'Asset', 'amount': 300000, 'type': 'debit'},
-        {'date': dates[0], 'account': 'Accounts Payable', 'category': 'Liability', 'amount': 80000, 'type': 'credit'},
-        {'date': dates[0], 'account': 'Long-term Debt', 'category': 'Liability', 'amount': 200000, 'type': 'credit'},
-        {'date': dates[0], 'account': 'Common Stock', 'category': 'Equity', 'amount': 500000, 'type': 'credit'},
-        {'date': dates[0], 'account': 'Retained Earnings', 'category': 'Equity', 'amount': 270000, 'type': 'credit'}
-    ])
+    rows = slice(2 * n_weekly + n_opex, total)
+    date_arr[rows] = dates.values[0]
+    amounts[rows] = [amount for _, _, amount, _ in opening]
+    account_codes[rows] = [accounts.index(acct) for acct, _, _, _ in opening]
+    category_codes[rows] = [categories.index(cat) for _, cat, _, _ in opening]
+    type_codes[rows] = [types.index(kind) for _, _, _, kind in opening]
     
-    return pd.DataFrame(transactions)
+    return pd.DataFrame({
+        'date': date_arr,
+        'account': pd.Categorical.from_codes(account_codes, categories=accounts),
+        'category': pd.Categorical.from_codes(category_codes, categories=categories),
+        'amount': amounts,
+        'type': pd.Categorical.from_codes(type_codes, categories=types)
+    })
 
 
 # Main execution
@@ -305,6 +516,10 @@ if __name__ == "__main__":
     transactions.to_csv('sample_transactions.csv', index=False)
     print("Sample data saved to sample_transactions.csv")
     
+    # Load it back the way real exports arrive, on the Arrow backend
+    transactions = pd.read_csv('sample_transactions.csv', dtype_backend='pyarrow',
+                               parse_dates=['date'])
+    
     # Generate financial statements
     print("\nGenerating financial statements...")
     generator = FinancialStatementGenerator(transactions)
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import Fsg
+
+
+@pytest.fixture
+def utc_transactions():
+    transactions = Fsg.generate_sample_data()
+    transactions['date'] = (transactions['date'] + pd.Timedelta(hours=23)).dt.tz_localize('UTC')
+    return transactions
+
+
+def _cached_files(cache_dir):
+    return sorted(path.name for path in cache_dir.glob('*.parquet'))
+
+
+def test_income_statement_cache_hit(utc_transactions, tmp_path, monkeypatch):
+    first = Fsg.FinancialStatementGenerator(utc_transactions, cache_dir=tmp_path)
+    expected = first.generate_income_statement('2024-03')
+    assert len(_cached_files(tmp_path)) == 1
+    
+    def fail(self, period):
+        raise AssertionError('statement recomputed on a cache hit')
+    
+    monkeypatch.setattr(Fsg.FinancialStatementGenerator, '_build_income_statement', fail)
+    second = Fsg.FinancialStatementGenerator(utc_transactions, cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(second.generate_income_statement('2024-03'), expected)
+
+
+def test_income_statement_cache_miss_on_changed_data(utc_transactions, tmp_path):
+    Fsg.FinancialStatementGenerator(utc_transactions, cache_dir=tmp_path).generate_income_statement('2024-03')
+    
+    changed = utc_transactions.copy()
+    changed.loc[changed['category'] == 'Sales & Marketing', 'amount'] += 100.0
+    cached = Fsg.FinancialStatementGenerator(changed, cache_dir=tmp_path).generate_income_statement('2024-03')
+    uncached = Fsg.FinancialStatementGenerator(changed).generate_income_statement('2024-03')
+    
+    assert len(_cached_files(tmp_path)) == 2
+    pd.testing.assert_frame_equal(cached, uncached)
+
+
+def test_income_statement_cache_miss_on_time_zone_change(utc_transactions, tmp_path):
+    Fsg.FinancialStatementGenerator(utc_transactions, cache_dir=tmp_path).generate_income_statement('2024-03')
+    
+    # Same instants, but the 2024-03-31 23:00 UTC opex lands in April in Tokyo
+    tokyo = utc_transactions.assign(date=utc_transactions['date'].dt.tz_convert('Asia/Tokyo'))
+    cached = Fsg.FinancialStatementGenerator(tokyo, cache_dir=tmp_path).generate_income_statement('2024-03')
+    uncached = Fsg.FinancialStatementGenerator(tokyo).generate_income_statement('2024-03')
+    
+    assert len(_cached_files(tmp_path)) == 2
+    pd.testing.assert_frame_equal(cached, uncached)
+    opex = cached.loc[cached['Line Item'] == 'Operating Expenses', 'Amount'].item()
+    assert np.isclose(opex, -54812, atol=1)